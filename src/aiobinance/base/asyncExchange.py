@@ -4,17 +4,124 @@
 # Created by David on 04/11/2024.
 # Copyright © 2024 David. All rights reserved.
 
-from datetime import datetime
+from asyncio import Semaphore, Task, create_task, get_running_loop, shield
+from asyncio import TimeoutError as AsyncTimeoutError
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from hashlib import sha256 as hashlib_sha256
-from hmac import new as hmac_new
-from re import search
-from ssl import create_default_context
+from ssl import SSLContext, create_default_context
+from time import monotonic, time_ns
 from zoneinfo import ZoneInfo
 
 from aiohttp import ClientError, ClientSession, TCPConnector
 from certifi import where as certifi_where
 
-from aiobinance.endpoints import Endpoints
+from aiobinance.base.errors import ExchangeException, InvalidApiKeyException
+from aiobinance.base.baseEndpoint import BaseEndpoint
+
+
+@lru_cache(maxsize=64)
+def _get_zone(tz: str) -> ZoneInfo:
+    """Return the `ZoneInfo` for `tz`, shared across exchange instances."""
+    return ZoneInfo(tz)
+
+
+# HMAC pads, as translation tables over the key bytes (RFC 2104)
+_HMAC_IPAD = bytes(x ^ 0x36 for x in range(256))
+_HMAC_OPAD = bytes(x ^ 0x5C for x in range(256))
+
+
+def _hmac_states(key: bytes):
+    """
+    Return the SHA-256 states already fed with the inner and outer padded `key`.
+    Copying them skips the key schedule when signing each message.
+    """
+    if len(key) > 64:
+        key = hashlib_sha256(key).digest()
+    key = key.ljust(64, b"\0")
+
+    return (
+        hashlib_sha256(key.translate(_HMAC_IPAD)),
+        hashlib_sha256(key.translate(_HMAC_OPAD)),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_ssl_context() -> SSLContext:
+    """Return the SSL context built from the certifi bundle, loaded only once."""
+    return create_default_context(cafile=certifi_where())
+
+
+# Connectors shared by the sessions of all the exchange instances, one per event loop,
+# each with the number of sessions still using it
+_CONNECTORS: dict = {}
+
+
+def _acquire_connector() -> TCPConnector:
+    """
+    Return the connector shared by all the exchange sessions of the running loop, so
+    they draw from the same pool of keep-alive connections, and count one more session
+    using it. Each call must be paired with `_release_connector`.
+    """
+    loop = get_running_loop()
+
+    # Forget the connectors of loops that have ended without releasing them
+    for oldLoop in [oldLoop for oldLoop in _CONNECTORS if oldLoop.is_closed()]:
+        del _CONNECTORS[oldLoop]
+
+    entry = _CONNECTORS.get(loop)
+
+    if entry is None or entry[0].closed:
+        # Keeps connections alive across fan-out requests, avoiding new TLS handshakes
+        connector = TCPConnector(
+            ssl=_get_ssl_context(),
+            limit=100,
+            limit_per_host=64,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+        )
+        entry = _CONNECTORS[loop] = [connector, 0]
+
+    entry[1] += 1
+
+    return entry[0]
+
+
+async def _release_connector(connector: TCPConnector) -> None:
+    """
+    Count one session less using the shared `connector`, closing it with its
+    keep-alive connections once no session of the running loop uses it anymore.
+    """
+    loop = get_running_loop()
+    entry = _CONNECTORS.get(loop)
+
+    # Already closed by `closeSharedConnector`
+    if entry is None or entry[0] is not connector:
+        return
+
+    entry[1] -= 1
+
+    if entry[1] <= 0:
+        del _CONNECTORS[loop]
+        await connector.close()
+
+
+# Unix epoch, timezone-naive and in UTC, to measure UTC timestamps in milliseconds
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+# Description of the HTTP error codes returned by the exchange
+_HTTP_ERRORS = {
+    400: "Bad request. Need to send the request with GET / POST (must be capitalized)",
+    401: "Unauthorized. 1. Invalid API Key; 2. Need to put authentication params in the request header",
+    403: "Forbidden request. Possible causes: 1. IP rate limit breached; 2. You send GET request with an empty json body",
+    404: "Cannot find path. Possible causes: 1. Wrong path",
+    405: "Method Not Allowed. You tried to access the resource with an invalid method",
+    500: "Internal Server Error. Try again later",
+    503: "Service Unavailable. Possible causes: 1. Maintenance. Try again later",
+}
 
 
 class AsyncExchange:
@@ -26,7 +133,15 @@ class AsyncExchange:
         w=604_800_000,
         M=2_592_000_000,
     )
+    # Maximum number of requests in flight at once for each exchange instance
+    MAX_CONCURRENT_REQUESTS = 20
     PUBLIC_IP = None
+    # Seconds after which the public IP is refreshed in the background
+    PUBLIC_IP_TTL = 300
+    # Monotonic time of the last successful public IP lookup
+    _PUBLIC_IP_TIME = 0.0
+    # In-flight public IP lookup, shared by concurrent callers
+    _PUBLIC_IP_TASK: Task | None = None
 
     def __init__(
         self,
@@ -41,20 +156,31 @@ class AsyncExchange:
 
         self._KEY = key
         self._SECRET = secret
+        self._SECRET_BYTES = secret.encode("utf-8") if secret else None
         self._PASSWORD = password
-        self._TIMEZONE = ZoneInfo(tz)
+        # HMAC inner and outer states keyed with the secret, copied for every signature
+        self._HMAC_INNER, self._HMAC_OUTER = (
+            _hmac_states(self._SECRET_BYTES) if secret else (None, None)
+        )
+        self._TIMEZONE = _get_zone(tz)
+        if tz in ("UTC", "Etc/UTC"):
+            self._timestamp = self._timestampUTC
 
         self.NAME = name
         self.baseURL = base_url
-        self._RECV_WINDOW = recvWindow
-
-        ssl_context = create_default_context(cafile=certifi_where())
+        # Stored as the string sent in signed payloads
+        self._RECV_WINDOW = str(recvWindow)
+        # Bounds the requests fanned out by date ranges and pagination
+        self._SEMAPHORE = Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        # Own base url and headers, over the connector shared by all the instances.
+        # Parameters always travel in the query string: no request has a body, so the
+        # Content-Type aiohttp would add on POST (application/octet-stream) is skipped
         self._SESSION = ClientSession(
             base_url=base_url,
-            connector=TCPConnector(ssl=ssl_context),
-            headers={
-                "Content-Type": "application/json",
-            },
+            connector=_acquire_connector(),
+            connector_owner=False,
+            skip_auto_headers=("Content-Type",),
         )
 
     #
@@ -66,37 +192,89 @@ class AsyncExchange:
     #
 
     async def close(self):
+        """
+        Close this instance's session. The connector shared with the other instances
+        is closed as well once this is the last one of the running loop.
+        """
+        if self._SESSION.closed:
+            return
+
+        connector = self._SESSION.connector
         await self._SESSION.close()
+        await _release_connector(connector)
 
-    async def _request(self, endPoint: Endpoints, params: dict = None):
+    @staticmethod
+    async def closeSharedConnector():
+        """
+        Close the connector shared by the exchange instances of the running loop right
+        away, even if some of them are still open. Not needed when all of them are
+        closed, since the last `close()` already does it.
+        """
+        entry = _CONNECTORS.pop(get_running_loop(), None)
+
+        if entry is not None:
+            await entry[0].close()
+
+    async def _request(self, endPoint: BaseEndpoint, params: dict = None):
         raise NotImplementedError
 
     async def _getPublicIP(self):
-        # Check if the public IP is already set
+        # Return the known public IP at once, refreshing it in the background once stale
         if AsyncExchange.PUBLIC_IP:
+            if (
+                AsyncExchange._PUBLIC_IP_TASK is None
+                and monotonic() - AsyncExchange._PUBLIC_IP_TIME >= self.PUBLIC_IP_TTL
+            ):
+                AsyncExchange._PUBLIC_IP_TASK = create_task(
+                    AsyncExchange._fetchPublicIP()
+                )
+
             return AsyncExchange.PUBLIC_IP
 
-        # Fetch public IP asynchronously
+        # Concurrent callers await the same request instead of racing each other
+        if AsyncExchange._PUBLIC_IP_TASK is None:
+            AsyncExchange._PUBLIC_IP_TASK = create_task(AsyncExchange._fetchPublicIP())
+
+        return await shield(AsyncExchange._PUBLIC_IP_TASK)
+
+    @staticmethod
+    async def _fetchPublicIP():
+        # Fetch public IP asynchronously, holding the shared connector since the lookup
+        # may outlive the instance that started it
+        connector = _acquire_connector()
         try:
             # Define own ClientSession because it has a different baseurl from the exchange
-            async with ClientSession() as session:
+            # (over the shared connector, reusing its pooled connections)
+            async with ClientSession(
+                connector=connector, connector_owner=False
+            ) as session:
                 async with session.get(url="https://api.ipify.org") as response:
                     # Raise exception for any HTTP errors (e.g., 4xx, 5xx)
                     response.raise_for_status()
 
                     # Store and return the public IP
                     AsyncExchange.PUBLIC_IP = await response.text()
+                    AsyncExchange._PUBLIC_IP_TIME = monotonic()
                     return AsyncExchange.PUBLIC_IP
 
-        except ClientError as e:
-            return None
+        except (ClientError, AsyncTimeoutError):
+            # A failed refresh keeps serving the previous IP, if any
+            return AsyncExchange.PUBLIC_IP
+
+        finally:
+            # Allow a new lookup, either after a failure or once this one is stale
+            AsyncExchange._PUBLIC_IP_TASK = None
+            await _release_connector(connector)
 
-    def _encrypt(self, msg) -> str:
-        hash = hmac_new(
-            key=bytes(self._SECRET, "utf-8"),
-            msg=msg.encode("utf-8"),
-            digestmod=hashlib_sha256,
-        )
+    def _encrypt(self, msg: str | bytes) -> str:
+        if msg.__class__ is str:
+            msg = msg.encode("utf-8")
+
+        inner = self._HMAC_INNER.copy()
+        inner.update(msg)
+
+        hash = self._HMAC_OUTER.copy()
+        hash.update(inner.digest())
 
         return hash.hexdigest()
 
@@ -119,12 +297,15 @@ class AsyncExchange:
             A tuple containing timestamps in milliseconds for `since` and `until`.
         """
 
+        # Both already in milliseconds
+        if since.__class__ is int and until.__class__ is int:
+            return (since, until)
+
         # SINCE
         start_ms = self._timestamp(since)
 
-        # UNTIL
-        until = until or datetime.now(tz=self._TIMEZONE)
-        end_ms = self._timestamp(until)
+        # UNTIL, the current time already in milliseconds if not given
+        end_ms = time_ns() // 1_000_000 if until is None else self._timestamp(until)
 
         return (start_ms, end_ms)
 
@@ -149,44 +330,72 @@ class AsyncExchange:
             If the `date` parameter is None.
         """
 
-        if isinstance(date, int):
+        if date.__class__ is int:
             return date
 
+        # Aware datetimes, the common case, are converted as they are
         if date.tzinfo:
-            date_aware = date
+            return int(date.timestamp() * 1000)
 
-        else:
-            date_aware = date.replace(tzinfo=self._TIMEZONE)
-
-        start_ms = int(date_aware.timestamp() * 1000)
-
-        return start_ms
-
-    def _checkHTTPErrors(self, code) -> str:
-        if code != 200:
-            match code:
-                case 400:
-                    msg = "Bad request. Need to send the request with GET / POST (must be capitalized)"
-                case 401:
-                    msg = "Unauthorized. 1. Invalid API Key; 2. Need to put authentication params in the request header"
-                case 403:
-                    msg = "Forbidden request. Possible causes: 1. IP rate limit breached; 2. You send GET request with an empty json body"
-                case 404:
-                    msg = "Cannot find path. Possible causes: 1. Wrong path"
-                case 405:
-                    msg = "Method Not Allowed. You tried to access the resource with an invalid method"
-                case 500:
-                    msg = "Internal Server Error. Try again later"
-                case 503:
-                    msg = "Service Unavailable. Possible causes: 1. Maintenance. Try again later"
-                case _:
-                    msg = "Unknown error."
-
-            return msg
-
-    def _timeInterval(self, tf: str) -> int:
+        return int(date.replace(tzinfo=self._TIMEZONE).timestamp() * 1000)
+
+    def _timestampUTC(self, date: datetime | int):
+        """
+        Same as `_timestamp`, specialized for when this timezone is UTC. Timezone-naive
+        datetimes are already in UTC, so the milliseconds are measured directly from the
+        epoch without attaching `self._TIMEZONE`. Bound in place of `_timestamp` at
+        construction.
+        """
+
+        if date.__class__ is int:
+            return date
+
+        if date.tzinfo:
+            return (date - _EPOCH_UTC) // _ONE_MS
+
+        return (date - _EPOCH) // _ONE_MS
+
+    def _raiseForStatus(self, code: int, **kwargs):
+        """
+        Raise the exception matching the HTTP status `code` of a failed response.
+        Only call it for non-200 responses, so successful ones skip the method call.
+
+        Parameters
+        ----------
+        code : int
+            The HTTP status code of the response.
+        **kwargs
+            Additional details forwarded to the exception, e.g. `endpoint`, `params`
+            and `response_message`.
+
+        Raises
+        ------
+        InvalidApiKeyException
+            If `code` is 401.
+        ExchangeException
+            For any other status code.
+        """
+
+        if code == 401:
+            # Only the end of the key, since the message ends up in tracebacks and logs
+            maskedKey = f"****{self._KEY[-4:]}" if self._KEY else None
+            raise InvalidApiKeyException(
+                exchange=self.NAME, api_key=maskedKey, ret_code=code, **kwargs
+            )
+
+        raise ExchangeException(
+            exchange=self.NAME,
+            message=f"{self.NAME}: {_HTTP_ERRORS.get(code, 'Unknown error.')}",
+            ret_code=code,
+            **kwargs,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _timeInterval(tf: str) -> int:
         """
         Given a time interval in the format '1x' or 'x1', returns its duration in milliseconds.
+        Results are cached, since only a handful of intervals are ever used.
 
         Parameters
         ----------
@@ -203,11 +412,14 @@ class AsyncExchange:
         int
             Duration in milliseconds.
         """
-        num = int(search(r"(\d+)", tf)[0])
-        timeInterval = search("([A-Za-z]{1})", tf)[0]
+        # Split the unit letter from the number, either '1x' or 'x1'
+        if tf[-1].isalpha():
+            timeInterval, num = tf[-1], int(tf[:-1])
+        else:
+            timeInterval, num = tf[0], int(tf[1:])
 
         # Convert to lowercase for dictionary lookup if needed
-        if timeInterval in ["S", "H", "D", "W"]:
+        if timeInterval in "SHDW":
             timeInterval = timeInterval.lower()
 
         millSecInterval = num * AsyncExchange.TIME_INTERVAL[timeInterval]
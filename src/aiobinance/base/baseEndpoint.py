@@ -4,10 +4,10 @@
 # Created by David on 07/11/2024.
 # Copyright © 2024 David. All rights reserved.
 
-from enum import Enum
-
-from aiolimiter import AsyncLimiter
+from enum import Enum, IntEnum
+from typing import Final
 
+from aiobinance.base.rateLimiter import TokenBucket
 from aiobinance.enums import EndpointSecurity
 
 
@@ -20,7 +20,7 @@ class ApiType(Enum):
     SAPI = "sapi"
 
 
-class LimitType(Enum):
+class LimitType(IntEnum):
     """
     Enum representing the type of limit imposed on an endpoint,
     either IP-based or ACCOUNT-based (UID)
@@ -31,13 +31,21 @@ class LimitType(Enum):
     IP_SEC = 2
 
 
-class Limits(Enum):
+class Limits:
     # API endpoints share the 6,000 per minute limit based on IP.
-    api_LIMIT = 6_000
+    api_LIMIT: Final = 6_000
     # Each SAPI endpoint has an independent limit counter, either based on IP or UID
-    sapi_IP_LIMIT = 12_000
-    sapi_UID_LIMIT = 180_000
-    sapi_IP_LIMIT_SEC = 180_000
+    sapi_IP_LIMIT: Final = 12_000
+    sapi_UID_LIMIT: Final = 180_000
+    sapi_IP_LIMIT_SEC: Final = 180_000
+
+
+# Rate (max_rate, time_period in seconds) of a '/sapi/' endpoint for each limit type
+_SAPI_LIMITS = {
+    LimitType.UID: (Limits.sapi_UID_LIMIT, 60),
+    LimitType.IP: (Limits.sapi_IP_LIMIT, 60),
+    LimitType.IP_SEC: (Limits.sapi_IP_LIMIT_SEC, 1),
+}
 
 
 class HTTPMethod(Enum):
@@ -75,8 +83,9 @@ class BaseEndpoint:
     Notes
     -----
     - The rate limit for `/api` endpoints is shared across all instances.
-    - The rate limit for `/sapi` endpoints is specific to each instance, depending on
-      whether it is an IP- or UID-based limit.
+    - The rate limit for `/sapi` endpoints is specific to each URL, depending on
+      whether it is an IP- or UID-based limit. Instances defined with the same URL
+      and limit type share the same limiter.
     - The limiter automatically adjusts based on the endpoint’s API type and limit type.
 
     Examples
@@ -89,9 +98,11 @@ class BaseEndpoint:
     """
 
     # Shared limiter for '/api' endpoints
-    _sharedLimiter = AsyncLimiter(max_rate=Limits.api_LIMIT.value, time_period=60)
+    _sharedLimiter = TokenBucket(max_rate=Limits.api_LIMIT, time_period=60)
+    # Limiters for '/sapi' endpoints, shared by endpoints with the same URL and limit type
+    _sapiLimiters: dict[tuple[str, LimitType], TokenBucket] = {}
 
-    __slots__ = "URL", "WEIGHT", "METHOD", "SECURITY", "_limiter"
+    __slots__ = "URL", "WEIGHT", "METHOD", "SECURITY", "SIGNED", "_limiter"
 
     def __init__(
         self,
@@ -104,29 +115,33 @@ class BaseEndpoint:
         self.URL: str = URL
         self.METHOD: HTTPMethod = METHOD
         self.SECURITY: EndpointSecurity = SECURITY
+        # Whether requests to this endpoint must be signed, resolved once
+        self.SIGNED: bool = SECURITY in EndpointSecurity.SIGNED
         self.WEIGHT: int = WEIGHT
 
         # The type of limit imposed on this endpoint, either IP-based or ACCOUNT-based (UID)
         # self.LIMIT_TYPE: LimitType = LIMIT_TYPE
 
         # The api endpoint type, either '/api/' or '/sapi/'
-        API_TYPE = ApiType(URL.split("/", maxsplit=2)[1])
+        if URL.startswith("/sapi/"):
+            API_TYPE = ApiType.SAPI
+        elif URL.startswith("/api/"):
+            API_TYPE = ApiType.API
+        else:
+            raise ValueError(f"'{URL}' is neither an '/api/' nor a '/sapi/' endpoint")
 
         if API_TYPE == ApiType.SAPI:
-            if LIMIT_TYPE == LimitType.UID:
-                self._limiter = AsyncLimiter(
-                    max_rate=Limits.sapi_UID_LIMIT.value, time_period=60
-                )
-            elif LIMIT_TYPE == LimitType.IP:
-                self._limiter = AsyncLimiter(
-                    max_rate=Limits.sapi_IP_LIMIT.value, time_period=60
-                )
-            elif LIMIT_TYPE == LimitType.IP_SEC:
-                self._limiter = AsyncLimiter(
-                    max_rate=Limits.sapi_IP_LIMIT_SEC.value, time_period=1
-                )
-
-        elif API_TYPE == ApiType.API:
+            key = (URL, LIMIT_TYPE)
+            limiter = BaseEndpoint._sapiLimiters.get(key)
+
+            if limiter is None:
+                max_rate, time_period = _SAPI_LIMITS[LIMIT_TYPE]
+                limiter = TokenBucket(max_rate=max_rate, time_period=time_period)
+                BaseEndpoint._sapiLimiters[key] = limiter
+
+            self._limiter = limiter
+
+        else:
             self._limiter = BaseEndpoint._sharedLimiter
 
     async def acquire(self):
@@ -134,7 +149,8 @@ class BaseEndpoint:
         await self._limiter.acquire(amount=self.WEIGHT)
 
     async def __aenter__(self) -> None:
-        await self.acquire()
+        # Awaits the limiter directly, skipping the `acquire` coroutine frame
+        await self._limiter.acquire(self.WEIGHT)
 
         return None
 
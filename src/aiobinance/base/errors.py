@@ -33,9 +33,11 @@ class UnmatchedIPError(ExchangeException):
     def __init__(self, exchange: str, ip_address: str, message: str = None, **kwargs):
         if message is None:
             message = f"IP address '{ip_address}' does not match any of the allowed IPs for this API Key."
-            for key, value in kwargs.items():
-                if value:
-                    message += f" {key}: '{value}'."
+            details = " ".join(
+                f"{key}: '{value}'." for key, value in kwargs.items() if value
+            )
+            if details:
+                message = f"{message} {details}"
 
         super().__init__(exchange=exchange, message=message, **kwargs)
 
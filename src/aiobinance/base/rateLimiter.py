@@ -0,0 +1,95 @@
+# rateLimiter.py
+# aiobinance
+#
+# Created by David on 15/10/2026.
+# Copyright © 2026 David. All rights reserved.
+
+from asyncio import Lock, get_running_loop, sleep
+from time import monotonic
+
+
+class TokenBucket:
+    """
+    Asynchronous token bucket rate limiter for weighted requests.
+
+    The bucket holds up to `max_rate` tokens and refills continuously at `max_rate`
+    tokens every `time_period` seconds. Each acquire takes `amount` tokens: when enough
+    are available it returns without suspending, otherwise the caller waits in FIFO
+    order until the bucket has refilled enough.
+
+    Parameters
+    ----------
+    max_rate : float
+        Capacity of the bucket, i.e. the total weight allowed within `time_period`.
+    time_period : float, default=60
+        Duration in seconds over which `max_rate` tokens are refilled.
+
+    Notes
+    -----
+    - No event loop is required at construction: the waiters' lock is bound on the
+      first acquire, and rebound if it happens under a different running loop. The
+      refill clock is `time.monotonic`, independent of the loop, so the time spent
+      between loops (e.g. successive `asyncio.run` calls) refills the bucket too.
+    - Only one waiter sleeps at a time, so a heavy request is not overtaken by
+      lighter ones queued after it.
+    """
+
+    __slots__ = (
+        "max_rate",
+        "time_period",
+        "_ratePerSec",
+        "_tokens",
+        "_last",
+        "_loop",
+        "_lock",
+    )
+
+    def __init__(self, max_rate: float, time_period: float = 60) -> None:
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._ratePerSec = max_rate / time_period
+
+        self._tokens = max_rate
+        self._last = None
+        self._loop = None
+        self._lock = None
+
+    def _refill(self, now: float) -> None:
+        if self._last is not None:
+            elapsed = now - self._last
+            self._tokens = min(self.max_rate, self._tokens + elapsed * self._ratePerSec)
+        self._last = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Take `amount` tokens from the bucket, waiting until they are available."""
+        if amount > self.max_rate:
+            raise ValueError("Can't acquire more than the maximum capacity")
+
+        loop = get_running_loop()
+        if loop is not self._loop:
+            # Bind to the running loop, e.g. after a previous `asyncio.run` has ended
+            self._loop = loop
+            self._lock = Lock()
+
+        self._refill(monotonic())
+
+        # Fast path: nobody is waiting and there is enough capacity
+        if not self._lock.locked() and self._tokens >= amount:
+            self._tokens -= amount
+            return
+
+        async with self._lock:
+            self._refill(monotonic())
+            while self._tokens < amount:
+                await sleep((amount - self._tokens) / self._ratePerSec)
+                self._refill(monotonic())
+
+            self._tokens -= amount
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
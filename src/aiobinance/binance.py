@@ -9,15 +9,75 @@ import logging
 import re
 from asyncio import create_task, gather
 from datetime import datetime
-from urllib.parse import urlencode
+from functools import lru_cache
+from itertools import chain
+from math import ceil
+from time import monotonic, time_ns
+from urllib.parse import quote_plus
+
+from yarl import URL
+
+try:
+    from orjson import dumps as orjson_dumps
+    from orjson import loads as json_loads
+
+    def json_dumps(obj) -> str:
+        return orjson_dumps(obj).decode()
+
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
 
 from aiobinance.base.asyncExchange import AsyncExchange
 from aiobinance.base.baseEndpoint import BaseEndpoint
-from aiobinance.endpoints import Endpoints
-from aiobinance.enums import EndpointSecurity, FiatTransactionType
+from aiobinance.endpoints import (
+    EXCHANGE_INFO,
+    FIAT_ORDERS,
+    KLINES,
+    SPOT_TRADES,
+    USER_ASSETS,
+)
+from aiobinance.enums import FiatTransactionType
+
+# Characters removed from symbols, allowing any delimiter (e.g. 'BTC/USDT')
+_SYMBOL_DELIMITERS = re.compile("[^A-Za-z0-9]")
+
+
+def _prepare_symbol(symbol: str) -> str:
+    """Return `symbol` as required by the API, e.g. 'btc/usdt' -> 'BTCUSDT'."""
+    return _SYMBOL_DELIMITERS.sub("", symbol).upper()
+
+
+@lru_cache(maxsize=256)
+def _dumps_strings(values: tuple[str, ...]) -> str:
+    """
+    Return the compact JSON array of the strings `values`, cached since the same lists
+    (e.g. of symbols) are sent over and over. Only for strings: equal values of other
+    types (e.g. 1, 1.0 and True) would share the same cache entry.
+    """
+    return json_dumps(list(values))
+
+
+def _urlencode(payload: dict) -> str:
+    """
+    Same as `urllib.parse.urlencode` for the payloads sent to the API, whose keys are plain
+    identifiers: keys and integer values are already URL-safe, so only the other values
+    are quoted.
+    """
+    return "&".join(
+        [
+            f"{k}={v}" if v.__class__ is int else f"{k}={quote_plus(str(v))}"
+            for k, v in payload.items()
+        ]
+    )
 
 
 class BinanceAsync(AsyncExchange):
+    # Seconds for which a `marketInfo` response is served from the cache
+    MARKET_INFO_TTL = 86_400
 
     def __init__(
         self,
@@ -43,6 +103,9 @@ class BinanceAsync(AsyncExchange):
 
         self.log = logging.getLogger(__name__)
 
+        # `marketInfo` responses by request arguments, as (monotonic time, response)
+        self._marketInfoCache: dict[tuple, tuple[float, dict]] = {}
+
     #
     # PUBLIC API
     #
@@ -79,33 +142,48 @@ class BinanceAsync(AsyncExchange):
         Returns
         -------
         dict
-            The JSON response from the Binance API, parsed as a dictionary. If there is an error,
-            returns a dictionary with an "error" key containing the error message.
+            The JSON response from the Binance API, parsed as a dictionary.
+
+        Raises
+        ------
+        ExchangeException
+            If the API responds with a non-200 status.
+
+        Notes
+        -----
+        - Exchange information changes rarely, so responses are cached for `MARKET_INFO_TTL`
+          seconds per combination of arguments. The cached dictionary is returned as is,
+          so it should not be mutated.
 
         Examples
         --------
         >>> get_binance_exchange_info(symbol="BNBBTC")
         >>> get_binance_exchange_info(symbols=["BTCUSDT", "BNBBTC"], permissions=["SPOT"], symbol_status="TRADING")
         """
-        ENDPOINT = Endpoints.EXCHANGE_INFO
+        ENDPOINT = EXCHANGE_INFO
+
+        key = (
+            symbol,
+            tuple(symbols or ()),
+            tuple(permissions or ()),
+            show_permission_sets,
+            symbol_status,
+        )
+        cached = self._marketInfoCache.get(key)
+        if cached and monotonic() - cached[0] < self.MARKET_INFO_TTL:
+            return cached[1]
 
         # Build request parameters
-        params = {
-            "symbol": self._prepareSymbol(symbol),
-            "symbols": [self._prepareSymbol(symbol) for symbol in symbols],
-            "permissions": permissions,
-            "showPermissionSets": show_permission_sets,
-            "symboslStatus": symbol_status,
-        }
         params = dict(
-            symbol=self._prepareSymbol(symbol),
-            symbols=[self._prepareSymbol(symbol) for symbol in symbols],
+            symbol=_prepare_symbol(symbol) if symbol else None,
+            symbols=list(map(_prepare_symbol, symbols)) if symbols else None,
             permissions=permissions,
             showPermissionSets=show_permission_sets,
-            symboslStatus=symbol_status,
+            symbolStatus=symbol_status,
         )
 
         info: dict = await self._request(endPoint=ENDPOINT, params=params)
+        self._marketInfoCache[key] = (monotonic(), info)
 
         return info
 
@@ -117,6 +195,7 @@ class BinanceAsync(AsyncExchange):
         until: int | datetime,
         timezone: str = "0",
         limit=1000,
+        raw=False,
     ) -> list[list[float | int]]:
         """
         Fetches and aggregates kline data for a given trading symbol
@@ -167,11 +246,22 @@ class BinanceAsync(AsyncExchange):
         limit : int, optional
             Maximum number of klines to retrieve per request (default is 1000).
 
+        raw : bool, default=False
+            If True, prices and volumes are returned as the strings sent by the API, skipping
+            the conversion to float. This preserves Binance's exact decimal precision and saves
+            the conversion when the data is loaded straight into pandas or numpy.
+
         Returns
         -------
         list of list of float or int
             A list of lists, where each inner list represents a kline with the following format:
             `[Open time, Open, High, Low, Close, Volume, Close time, Quote asset volume, Number of trades, Taker buy base asset volume, Taker buy quote asset volume, Unused field, ignore]`.
+            If `raw` is True, the float fields are strings instead.
+
+        Raises
+        ------
+        ExchangeException
+            If the API responds with a non-200 status.
 
         Notes
         -----
@@ -180,7 +270,7 @@ class BinanceAsync(AsyncExchange):
         - Response time is in UTC.
         """
 
-        symbol = self._prepareSymbol(symbol)
+        symbol = _prepare_symbol(symbol)
 
         START_MS, END_MS = self._parseTime(since, until)
 
@@ -188,11 +278,12 @@ class BinanceAsync(AsyncExchange):
         BASE_STEP = self._timeInterval(timeframe)
         STEP = BASE_STEP * limit
         tasks = []
-        # stop = END_MS + BASE_STEP because the stop must be included
-        # step =  STEP + BASE_STEP to avoid repeated data (otherwise the last
-        # kline of the previous request is the same as the start of the new one)
-        for start in range(START_MS, END_MS + BASE_STEP, STEP + BASE_STEP):
-            end = min(END_MS, start + STEP)
+        # stop = END_MS + 1 because the stop must be included
+        # Each window spans one STEP, [start, start + STEP - 1] as endTime is inclusive:
+        # it holds at most `limit` klines even when `since` is not on an interval
+        # boundary, and the next one starts right after it without gaps or repeated data
+        for start in range(START_MS, END_MS + 1, STEP):
+            end = min(END_MS, start + STEP - 1)
             tasks.append(
                 create_task(
                     self._baseKlines(
@@ -203,12 +294,13 @@ class BinanceAsync(AsyncExchange):
                             endTime=end,
                             timeZone=timezone,
                             limit=limit,
-                        )
+                        ),
+                        raw=raw,
                     )
                 )
             )
 
-        klines = await gather(*tasks)
+        klines = list(chain.from_iterable(await gather(*tasks)))
         # logger.debug("Downloaded all klines.")
 
         return klines
@@ -262,21 +354,31 @@ class BinanceAsync(AsyncExchange):
         list[dict]
             A list of trades as dictionaries, each containing trade data for the specified `symbol`.
 
+        Raises
+        ------
+        InvalidApiKeyException
+            If the API key is rejected (HTTP 401).
+        ExchangeException
+            If the API responds with any other non-200 status.
+
         Notes
         -----
         - If both `since` and `until` are specified, the method will use a time-based interval split approach
           to ensure that the API time range limits are respected. So the time range between `startTime` and
-          `endTime` can exceed the API limitation.
+          `endTime` can exceed the API limitation. The 24h windows are requested concurrently, and a
+          window holding more than `limit` trades is paginated by trade ID.
+        - With `since` only, trades are paginated sequentially by trade ID: the number of requests depends
+          on the number of trades, not on the length of the time range.
         - `until` with `since=None` will restrict fetching to a single request, disregarding `enforceLimit`.
         """
 
-        ENDPOINT = Endpoints.SPOT_TRADES
+        ENDPOINT = SPOT_TRADES
 
         START_MS = self._timestamp(since) if since else None
         END_MS = self._timestamp(until) if until else None
 
         params = dict(
-            symbol=self._prepareSymbol(symbol),
+            symbol=_prepare_symbol(symbol),
             orderId=orderId,
             startTime=START_MS,
             endTime=END_MS,
@@ -289,7 +391,10 @@ class BinanceAsync(AsyncExchange):
             INTERVAL = 1_000 * 60 * 60 * 24
 
             data = await self._split_request_interval(
-                endpoint=ENDPOINT, maxRange=INTERVAL, params=params
+                endpoint=ENDPOINT,
+                maxRange=INTERVAL,
+                params=params,
+                func=self._tradesWindow,
             )
 
         else:
@@ -346,11 +451,18 @@ class BinanceAsync(AsyncExchange):
             ...
         ]
 
+        Raises
+        ------
+        InvalidApiKeyException
+            If the API key is rejected (HTTP 401).
+        ExchangeException
+            If the API responds with any other non-200 status.
+
         Notes
         -----
         - The `btcValuation` value in the response will be `0` if `needBtcValuation` is set to `False`.
         """
-        ENDPOINT = Endpoints.USER_ASSETS
+        ENDPOINT = USER_ASSETS
 
         params = {
             "asset": asset,
@@ -414,6 +526,13 @@ class BinanceAsync(AsyncExchange):
             - createTime (int): The creation timestamp of the transaction in milliseconds since the epoch.
             - updateTime (int): The last updated timestamp of the transaction in milliseconds since the epoch.
 
+        Raises
+        ------
+        InvalidApiKeyException
+            If the API key is rejected (HTTP 401).
+        ExchangeException
+            If the API responds with any other non-200 status.
+
         Examples
         --------
         ```python
@@ -425,7 +544,7 @@ class BinanceAsync(AsyncExchange):
         ```
         """
 
-        ENDPOINT = Endpoints.FIAT_ORDERS
+        ENDPOINT = FIAT_ORDERS
 
         # unixtime
         start_ms, end_ms = self._parseTime(since, until)
@@ -481,7 +600,7 @@ class BinanceAsync(AsyncExchange):
         - When paginating, it updates the payload with the last trade ID in each response to fetch the next batch.
         """
 
-        ENDPOINT = Endpoints.SPOT_TRADES
+        ENDPOINT = SPOT_TRADES
 
         payload = params.copy()
         limit: int = params["limit"]
@@ -508,32 +627,92 @@ class BinanceAsync(AsyncExchange):
 
         return data
 
-    async def _baseKlines(self, params: dict) -> list[list[float | int]]:
+    async def _tradesWindow(self, endpoint: BaseEndpoint, params: dict) -> list[dict]:
+        """
+        Fetches all the trades between `startTime` and `endTime` in `params`.
+
+        The API returns at most `limit` trades for a time range, so a full response is
+        followed by pages requested by trade ID until the window's `endTime` is passed.
+
+        Parameters
+        ----------
+        endpoint : BaseEndpoint
+            The endpoint to which the requests are sent.
+        params : dict
+            Dictionary of parameters of the request. Required keys include "limit",
+            "startTime" and "endTime", spanning at most 24h.
+
+        Returns
+        -------
+        list[dict]
+            Returns a list of trade data dictionaries within the window.
+
+        Notes
+        -----
+        - Pages after the first are requested sequentially, since each one starts from
+          the last trade ID of the previous page.
+        """
+
+        limit: int = params["limit"]
+        END_MS: int = params["endTime"]
+
+        resp = await self._request(endPoint=endpoint, params=params)
+        data = list(resp)
+
+        # 'fromId' can't be combined with a time range: trades past the window's endTime,
+        # inclusive, are dropped, as they belong to the next window
+        payload = params.copy()
+        payload["startTime"] = payload["endTime"] = None
+
+        while len(resp) == limit:
+            payload["fromId"] = resp[-1]["id"] + 1
+
+            resp = await self._request(endPoint=endpoint, params=payload)
+            resp = [trade for trade in resp if trade["time"] <= END_MS]
+            data.extend(resp)
+
+        return data
+
+    async def _baseKlines(self, params: dict, raw=False) -> list[list[float | int]]:
         klineList: list[list] = await self._request(
-            endPoint=Endpoints.KLINES,
+            endPoint=KLINES,
             params=params,
         )
 
+        if raw:
+            return klineList
+
         # 'Open time', 'Open', 'High', 'Low', 'Close', 'Volume', 'Close time', 'Quote asset volume', 'Number of trades', 'Taker buy base asset volume', 'Taker buy quote asset volume', 'Unused field, ignore'
-        stringField = {1, 2, 3, 4, 5, 7, 9, 10}
+        # The row shape is fixed, so the string fields are converted by index
         klines = [
             [
-                float(field) if idx in stringField else field
-                for idx, field in enumerate(kline)
+                k[0],
+                float(k[1]),
+                float(k[2]),
+                float(k[3]),
+                float(k[4]),
+                float(k[5]),
+                k[6],
+                float(k[7]),
+                k[8],
+                float(k[9]),
+                float(k[10]),
+                k[11],
             ]
-            for kline in klineList
+            for k in klineList
         ]
 
         return klines
 
     async def _paginatedRequests(
         self,
-        endPoint: Endpoints,
+        endPoint: BaseEndpoint,
         params: dict = None,
         rowsKey="rows",
         pageKey="page",
         dataKey="data",
         totalKey="total",
+        expectedPages: int = 1,
     ):
         """
         Fetches data from a paginated API endpoint asynchronously.
@@ -545,7 +724,7 @@ class BinanceAsync(AsyncExchange):
 
         Parameters
         ----------
-        endPoint : Endpoints
+        endPoint : BaseEndpoint
             The endpoint to which the request is sent.
         params : dict, optional
             A dictionary of query parameters to include with each request.
@@ -557,8 +736,11 @@ class BinanceAsync(AsyncExchange):
             The key in the API response where the data is stored. Defaults to "data".
         totalKey : str, optional
             The key in the API response where the total number of pages is stored. Defaults to "total".
-        method : str, optional
-            The HTTP method to use for the requests. Defaults to "GET".
+        expectedPages : int, default=1
+            Number of pages requested together with the first one, before the total is known,
+            saving a round-trip when the data spans that many pages. The pages found to be
+            beyond the total are cancelled, but their weight may already have been spent: raise
+            it only on endpoints whose weight is small compared to their rate limit.
 
         Returns
         -------
@@ -575,7 +757,8 @@ class BinanceAsync(AsyncExchange):
 
         Notes
         -----
-        - The function avoids mutating the original `params` dictionary by copying it.
+        - The function avoids mutating the original `params` dictionary by copying it,
+          and each page is requested with its own copy.
         """
 
         payload = params.copy()
@@ -583,51 +766,78 @@ class BinanceAsync(AsyncExchange):
 
         data = []
 
-        # Make first request to know the total number of items to retrieve
-        payload[pageKey] = 1
-        resp = await self._request(endPoint=endPoint, params=payload)
-        data.extend(resp[dataKey])
+        # Make first request to know the total number of items to retrieve,
+        # together with the following expected pages
+        firstPages = max(1, expectedPages)
+        tasks = [
+            create_task(
+                self._request(endPoint=endPoint, params={**payload, pageKey: page})
+            )
+            for page in range(1, firstPages + 1)
+        ]
 
-        # Make following requests asyncronously
-        tasks = []
-        for _ in range(itemsPerRequest, resp[totalKey] + 1, itemsPerRequest):
-            payload[pageKey] += 1
-            tasks.append(create_task(self._request(endPoint=endPoint, params=payload)))
+        try:
+            resp = await tasks[0]
+        except BaseException:
+            for task in tasks[1:]:
+                task.cancel()
+            raise
 
-        resp = await gather(*tasks)
-        data.extend([x for r in resp for x in r[dataKey]])
+        data.extend(resp[dataKey])
+        totalPages = ceil(resp[totalKey] / itemsPerRequest)
+
+        # Cancel the expected pages beyond the total
+        if totalPages < firstPages:
+            extraTasks = tasks[max(1, totalPages) :]
+            for task in extraTasks:
+                task.cancel()
+            await gather(*extraTasks, return_exceptions=True)
+
+        # Make following requests asyncronously: gather schedules the coroutines itself,
+        # each with its own payload
+        coros = [
+            self._request(endPoint=endPoint, params={**payload, pageKey: page})
+            for page in range(firstPages + 1, totalPages + 1)
+        ]
+
+        resp = await gather(*tasks[1 : max(1, totalPages)], *coros)
+        data.extend(chain.from_iterable(r[dataKey] for r in resp))
 
         return data
 
     async def _split_request_interval(
-        self, endpoint: Endpoints, maxRange: int, params: dict, func=None
+        self, endpoint: BaseEndpoint, maxRange: int, params: dict, func=None
     ):
         START_MS = params["startTime"]
         END_MS = params["endTime"]
 
         func = func or self._request
 
-        payload = params.copy()
         tasks = []
-        for start in range(START_MS, END_MS, maxRange):
+        # Windows are half-open, [start, start + maxRange - 1], since the API includes
+        # both bounds: a record on a window boundary is fetched only once.
+        # stop = END_MS + 1 because the stop must be included
+        for start in range(START_MS, END_MS + 1, maxRange):
+            # Each task needs its own payload: they all run after the loop
+            payload = params.copy()
             payload["startTime"] = start
-            payload["endTime"] = min(END_MS, start + maxRange)
+            payload["endTime"] = min(END_MS, start + maxRange - 1)
 
             tasks.append(create_task(func(endpoint, payload)))
 
         resp = await gather(*tasks)
-        data = [x for l in resp for x in l]
+        data = list(chain.from_iterable(resp))
 
         return data
 
-    async def _request(self, endPoint: Endpoints, params: dict = None):
+    async def _request(self, endPoint: BaseEndpoint, params: dict = None):
         """
         Asynchronously send an HTTP request to a specified endpoint with optional
         parameters and signing, while respecting endpoint-specific rate limits.
 
         Parameters
         ----------
-        endPoint : Endpoints
+        endPoint : BaseEndpoint
             The endpoint to which the request is sent.
         params : dict, optional
             A dictionary of parameters to include in the request payload.
@@ -643,8 +853,17 @@ class BinanceAsync(AsyncExchange):
             The JSON-decoded response from the endpoint, which could be a
             dictionary or list based on the API response.
 
+        Raises
+        ------
+        ExchangeException
+            If the response status is not 200, see `_raiseForStatus`.
+
         Notes
         -----
+        - **Decoding**: Responses are decoded with `orjson` when installed, falling back to
+          the standard `json` module, after the concurrency slot has been released.
+        - **Concurrency**: At most `MAX_CONCURRENT_REQUESTS` requests are in flight at once,
+          so large date ranges and paginations don't exhaust the connection pool.
         - **Rate Limiting**: The method respects the endpoint’s rate limit:
             - Determines if the rate limit for the specified endpoint has been reached.
             - Pauses the request if the rate limit is exceeded, waiting until the rate limit is reset.
@@ -652,86 +871,116 @@ class BinanceAsync(AsyncExchange):
             Using `await` for this check ensures that the pause, if needed, is
             non-blocking, allowing other asynchronous tasks to proceed without delay.
         """
-        # Obtains the endpoint details
-        baseEndpoint: BaseEndpoint = endPoint.value
-
         # This ensures that the rate-limit of the endpoint is respected
-        async with baseEndpoint:
-
-            # Payload is prepared inside the rate-limiter because the timeout of sign
-            payload = self._preparePayload(
-                params=params, security=baseEndpoint.SECURITY
-            )
-
-            async with self._SESSION.request(
-                method=baseEndpoint.METHOD.value, url=baseEndpoint.URL, params=payload
-            ) as resp:
+        async with endPoint:
+
+            # Bounds the number of concurrent requests
+            async with self._SEMAPHORE:
+                # Payload is prepared inside the rate-limiter because the timeout of sign
+                query = self._preparePayload(params=params, signed=endPoint.SIGNED)
+
+                # Already encoded, so the query sent is identical to the signed one
+                url = f"{endPoint.URL}?{query}" if query else endPoint.URL
+
+                async with self._SESSION.request(
+                    method=endPoint.METHOD.value,
+                    url=URL(url, encoded=True),
+                ) as resp:
+
+                    # Arguments are formatted lazily, only when debug logging is enabled
+                    self.log.debug("%s %s", resp.status, resp.real_url)
+                    if self.log.isEnabledFor(logging.DEBUG):
+                        self.log.debug("%s", resp.headers)
+
+                    if resp.status != 200:
+                        self._raiseForStatus(
+                            resp.status,
+                            endpoint=endPoint.URL,
+                            params=params,
+                            response_message=await resp.text(),
+                        )
 
-                self.log.debug(resp.real_url)
-                self.log.debug(resp.headers)
+                    body = await resp.read()
 
-                data: dict | list = await resp.json()
+        # Decoding is local work: done after the connection slot is released
+        data: dict | list = json_loads(body)
 
-                self.log.debug(data)
+        self.log.debug(data)
 
         return data
 
-    def _preparePayload(self, params: dict | None, security: EndpointSecurity) -> dict:
+    def _preparePayload(self, params: dict | None, signed: bool) -> str:
         """
-        Prepare the request payload by removing any key-value pairs with `None` values and
+        Prepare the request query string by removing any key-value pairs with `None` values and
         converting certain data types as required.
 
         Parameters
         ----------
         params : dict, optional
             The dictionary containing the initial payload parameters for the request.
-        sign : bool, default=True
+        signed : bool
             If True, sign the payload for authentication.
 
         Returns
         -------
-        dict
-            A `new` dictionary containing only key-value pairs from `params` where values are not `None`
+        str
+            The URL-encoded query string of the key-value pairs from `params` where values are not `None`
             or empty collections. Additionally, it converts boolean values to lowercase strings, lists
-            to JSON strings, and, if `sign` is True, adds `recvWindow`, `timestamp`, and `signature` fields.
+            to JSON strings, and, if `signed` is True, adds `recvWindow`, `timestamp`, and `signature` fields.
 
         Notes
         -----
         - Boolean values are converted to lowercase strings ("true" or "false").
         - Lists are JSON-encoded with compact separators (`,`, `:`).
-        - When `sign` is enabled, a timestamp and a signature are generated using internal helper methods.
+        - When `signed` is enabled, a timestamp and a signature are generated using internal helper methods.
+        - The query string is encoded only once: the signature is computed on the exact string that is sent.
 
         """
 
+        # Nothing to encode for public requests without parameters
+        if not params and not signed:
+            return ""
+
         payload = dict()
 
         if params is not None:
 
             for k, v in params.items():
-                # Skip None values or empty collections
-                if v is None or (hasattr(v, "__len__") and len(v) == 0):
-                    continue
+                # Exact class checks: cheaper than isinstance, hasattr and len per key
+                cls = v.__class__
+
+                if cls is int or cls is float:
+                    payload[k] = v
+
+                elif cls is str:
+                    # Skip empty strings
+                    if v:
+                        payload[k] = v
 
-                if isinstance(v, bool):
-                    payload[k] = str(v).lower()
+                elif cls is bool:
+                    payload[k] = "true" if v else "false"
 
-                elif isinstance(v, list):
-                    payload[k] = json.dumps(v, separators=(",", ":"))
+                elif cls is list:
+                    # Skip empty lists
+                    if v:
+                        if all(item.__class__ is str for item in v):
+                            payload[k] = _dumps_strings(tuple(v))
+                        else:
+                            payload[k] = json_dumps(v)
 
-                else:
+                # Skip None values or other empty collections
+                elif v is not None and not (hasattr(v, "__len__") and len(v) == 0):
                     payload[k] = v
 
-        if security in EndpointSecurity.SIGNED:
+        if signed:
             # Adds recv and timestamp and generates signature
             payload["recvWindow"] = self._RECV_WINDOW
-            payload["timestamp"] = str(int(datetime.now().timestamp() * 1000))
-            payload["signature"] = self._sign(payload)
+            payload["timestamp"] = str(time_ns() // 1_000_000)
 
-        return payload
+            return self._sign(_urlencode(payload))
 
-    def _prepareSymbol(self, symbol: str):
-        return re.sub("[^A-Za-z0-9]", "", symbol).upper()
+        return _urlencode(payload)
 
-    def _sign(self, params):
-        param_str = urlencode(params)
-        return self._encrypt(param_str)
+    def _sign(self, query: str) -> str:
+        """Append the signature of the URL-encoded `query` to it."""
+        return f"{query}&signature={self._encrypt(query)}"